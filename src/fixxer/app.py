@@ -16,16 +16,19 @@ FIXXER ✞ TUI (v1.1) - Refactored & Optimized
 from __future__ import annotations
 
 import importlib.resources
+import importlib.util
+import os
+import re
 import threading
 import time
+from collections import deque
 from pathlib import Path
 from typing import Dict, Any, Optional
 from datetime import datetime
 
 from rich.table import Table
-from rich.progress import Progress, SpinnerColumn, BarColumn, TextColumn, TimeElapsedColumn
 
-from textual import on, work
+from textual import on
 from textual.app import App, ComposeResult
 from textual.binding import Binding
 from textual.containers import Container, Horizontal, Vertical, ScrollableContainer
@@ -123,6 +126,19 @@ except ImportError as e:
         return False  # Can't save in test mode
 
 
+# Extension lookups for the source-directory scan (hash membership, built once)
+STANDARD_IMAGE_EXTS = frozenset({'.jpg', '.jpeg', '.png', '.tiff', '.tif', '.bmp', '.webp'})
+RAW_IMAGE_EXTS = frozenset({'.rw2', '.arw', '.cr2', '.cr3', '.nef', '.dng', '.raf', '.orf', '.pef', '.srw'})
+
+# Log separators, built once instead of per workflow start
+LOG_SEPARATOR = "=" * 50
+PREVIEW_LOG_RULE = "=" * 70
+
+# Rich markup tags, stripped when the preview log is written to disk
+# (never spans lines, so the whole buffer can be stripped in one pass)
+RICH_MARKUP_RE = re.compile(r'\[/?[a-z]+[^\]\n]*\]')
+
+
 # ==============================================================================
 # Pre-check BRISQUE and CLIP availability (before Textual starts)
 # ==============================================================================
@@ -158,11 +174,11 @@ try:
     else:
         CLIP_STATUS = "fallback"
 except ImportError:
-    try:
-        from sentence_transformers import SentenceTransformer
-        from sklearn.cluster import DBSCAN
+    # Probe for the packages without importing them - sentence_transformers
+    # pulls in torch, which costs seconds of startup just to report a status
+    if importlib.util.find_spec("sentence_transformers") and importlib.util.find_spec("sklearn"):
         CLIP_STATUS = "direct"
-    except ImportError:
+    else:
         CLIP_STATUS = "fallback"
 
 
@@ -462,7 +478,7 @@ class RAMMonitor(Container):
     
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        self.ram_data = [0.0] * 20  # Reduced points for footer
+        self.ram_data = deque([0.0] * 20, maxlen=20)  # Reduced points for footer
         self.update_timer: Optional[Timer] = None
     
     def compose(self) -> ComposeResult:
@@ -472,7 +488,7 @@ class RAMMonitor(Container):
         
         with Horizontal(classes="sysmon-row"):
             yield Static("RAM", classes="sysmon-label")
-            yield Sparkline(self.ram_data, id="ram-sparkline", classes="sysmon-sparkline")
+            yield Sparkline(list(self.ram_data), id="ram-sparkline", classes="sysmon-sparkline")
             yield Static("0%", id="ram-value", classes="sysmon-value")
     
     def on_mount(self) -> None:
@@ -491,7 +507,6 @@ class RAMMonitor(Container):
             ram = psutil.virtual_memory()
             ram_percent = ram.percent
             self.ram_data.append(ram_percent)
-            self.ram_data.pop(0)
             
             try:
                 sparkline = self.query_one("#ram-sparkline", Sparkline)
@@ -511,7 +526,7 @@ class CPUMonitor(Container):
     
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        self.cpu_data = [0.0] * 20  # Reduced points for footer
+        self.cpu_data = deque([0.0] * 20, maxlen=20)  # Reduced points for footer
         self.update_timer: Optional[Timer] = None
     
     def compose(self) -> ComposeResult:
@@ -521,7 +536,7 @@ class CPUMonitor(Container):
         
         with Horizontal(classes="sysmon-row"):
             yield Static("CPU", classes="sysmon-label")
-            yield Sparkline(self.cpu_data, id="cpu-sparkline", classes="sysmon-sparkline")
+            yield Sparkline(list(self.cpu_data), id="cpu-sparkline", classes="sysmon-sparkline")
             yield Static("0%", id="cpu-value", classes="sysmon-value")
     
     def on_mount(self) -> None:
@@ -539,7 +554,6 @@ class CPUMonitor(Container):
         try:
             cpu_percent = psutil.cpu_percent(interval=None)
             self.cpu_data.append(cpu_percent)
-            self.cpu_data.pop(0)
             
             try:
                 sparkline = self.query_one("#cpu-sparkline", Sparkline)
@@ -560,9 +574,10 @@ class LogPanel(Container):
     
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        self.logs = []
         self.max_logs = 1000
+        self.logs = deque(maxlen=self.max_logs)  # Oldest lines fall off in O(1)
         self.lock = threading.Lock()
+        self._update_pending = False
     
     def compose(self) -> ComposeResult:
         yield ScrollableContainer(
@@ -575,9 +590,11 @@ class LogPanel(Container):
         with self.lock:
             timestamp = datetime.now().strftime("%H:%M:%S")
             self.logs.append(f"[dim]{timestamp}[/dim] {message}")
-            
-            if len(self.logs) > self.max_logs:
-                self.logs.pop(0)
+
+            # Coalesce bursts of log lines into a single redraw
+            if self._update_pending:
+                return
+            self._update_pending = True
         
         self._schedule_display_update()
     
@@ -585,7 +602,8 @@ class LogPanel(Container):
         try:
             self.app.post_message(self.UpdateLogDisplay())
         except Exception:
-            pass 
+            with self.lock:
+                self._update_pending = False
     
     class UpdateLogDisplay(Message):
         """Message to signal a log update."""
@@ -593,10 +611,11 @@ class LogPanel(Container):
     
     def update_display_from_app(self) -> None:
         """The actual UI update, called by the app thread."""
+        with self.lock:
+            self._update_pending = False
+            log_text = "\n".join(self.logs)
         try:
             log_content = self.query_one("#log-content", Static)
-            with self.lock:
-                log_text = "\n".join(self.logs)
             
             log_content.update(log_text)
             container = self.query_one("#log-container", ScrollableContainer)
@@ -751,6 +770,8 @@ class FixxerTUI(App):
         "□ □ ■",
         "□ ■ □",
     ]
+    # Styled frames built once; the spinner ticks every 200ms
+    _SPINNER_MARKUP = tuple(f"[bold red]{frame}[/bold red]" for frame in BLOCK_SPINNER_FRAMES)
     
     class UpdateStatusBar(Message):
         """Message to signal a status bar update."""
@@ -799,6 +820,7 @@ class FixxerTUI(App):
         self.status_bar: Optional[Static] = None
         self.spinner_display: Optional[Static] = None
         self.progress_phrase: Optional[Static] = None
+        self._phrase_text: Optional[str] = None  # Last text pushed to progress_phrase
         self.progress_timer_display: Optional[Static] = None
         self.progress_container: Optional[Container] = None  # For compact/expanded state
         self.milestone_hud: Optional[MilestoneHUD] = None  # HUD reference (Pro Mode only)
@@ -946,7 +968,7 @@ class FixxerTUI(App):
         
         # Log supported extensions for debugging
         if SUPPORTED_EXTENSIONS:
-            raw_exts = [ext for ext in SUPPORTED_EXTENSIONS if ext.upper() in ['.RW2', '.ARW', '.CR2', '.CR3', '.NEF', '.DNG', '.RAF', '.ORF', '.PEF', '.SRW']]
+            raw_exts = [ext for ext in SUPPORTED_EXTENSIONS if ext.lower() in RAW_IMAGE_EXTS]
             self.write_to_log(f"✓ Supported extensions: {len(SUPPORTED_EXTENSIONS)} types")
             if raw_exts:
                 self.write_to_log(f"  Added RAW formats: {', '.join(sorted(set([e.lower() for e in raw_exts])))}")
@@ -1002,24 +1024,29 @@ class FixxerTUI(App):
             if not p.is_dir():
                 return
             
-            # Count files by type
-            all_files = list(p.glob("*"))
-            image_files = []
-            raw_files = []
+            # Count files by type (scandir reuses directory entry data; no Path per file)
+            image_count = 0
+            raw_count = 0
+            first_raw_suffix = ""
             
-            for f in all_files:
-                if f.is_file():
-                    ext = f.suffix.lower()
-                    if ext in ['.jpg', '.jpeg', '.png', '.tiff', '.tif', '.bmp', '.webp']:
-                        image_files.append(f)
-                    elif ext in ['.rw2', '.arw', '.cr2', '.cr3', '.nef', '.dng', '.raf', '.orf', '.pef', '.srw']:
-                        raw_files.append(f)
+            with os.scandir(p) as entries:
+                for entry in entries:
+                    if not entry.is_file():
+                        continue
+                    suffix = os.path.splitext(entry.name)[1]
+                    ext = suffix.lower()
+                    if ext in STANDARD_IMAGE_EXTS:
+                        image_count += 1
+                    elif ext in RAW_IMAGE_EXTS:
+                        if not raw_count:
+                            first_raw_suffix = suffix
+                        raw_count += 1
             
-            if raw_files:
-                self.write_to_log(f"  Found {len(raw_files)} RAW files ({raw_files[0].suffix})")
-            if image_files:
-                self.write_to_log(f"  Found {len(image_files)} standard image files")
-            if not raw_files and not image_files:
+            if raw_count:
+                self.write_to_log(f"  Found {raw_count} RAW files ({first_raw_suffix})")
+            if image_count:
+                self.write_to_log(f"  Found {image_count} standard image files")
+            if not raw_count and not image_count:
                 self.write_to_log(f"  [yellow]No image files found in {p.name}[/yellow]")
                 
         except Exception as e:
@@ -1116,7 +1143,7 @@ class FixxerTUI(App):
     
     def start_progress_tracking(self) -> None:
         """Start the spinner animation and phrase rotation."""
-        self.workflow_start_time = time.time()
+        self.workflow_start_time = time.monotonic()
         self.spinner_frame_index = 0
         
         # Start spinner animation (fast - every 200ms)
@@ -1144,8 +1171,7 @@ class FixxerTUI(App):
             return
         
         # Use block spinner for that cool retro look
-        frame = self.BLOCK_SPINNER_FRAMES[self.spinner_frame_index % len(self.BLOCK_SPINNER_FRAMES)]
-        self.spinner_display.update(f"[bold red]{frame}[/bold red]")
+        self.spinner_display.update(self._SPINNER_MARKUP[self.spinner_frame_index % len(self._SPINNER_MARKUP)])
         self.spinner_frame_index += 1
     
     @on(UpdateSpinner)
@@ -1159,35 +1185,35 @@ class FixxerTUI(App):
         
         # Only rotate if workflow is active
         if self.workflow_start_time:
+            elapsed = time.monotonic() - self.workflow_start_time
             if self.app_config.get('pro_mode', False):
                 # PRO MODE: Professional, time-based status messages
-                elapsed = time.time() - self.workflow_start_time
-                minutes = int(elapsed // 60)
-                seconds = int(elapsed % 60)
+                minutes, seconds = divmod(int(elapsed), 60)
                 if minutes > 0:
                     phrase = f"Processing active... [{minutes}m {seconds}s elapsed]"
                 else:
                     phrase = f"Processing active... [{seconds}s elapsed]"
             else:
                 # STANDARD MODE: Warez phrases
-                elapsed = time.time() - self.workflow_start_time
                 phrase = get_phrase_by_duration(elapsed, use_meta=True)
         else:
             # Ready state
             phrase = "System Ready" if self.app_config.get('pro_mode', False) else "Ready to process"
         
-        # Force refresh the widget
-        self.progress_phrase.update(phrase)
-        self.progress_phrase.refresh()
+        self._set_phrase(phrase)
+
+    def _set_phrase(self, phrase: str) -> None:
+        """Update the progress phrase, skipping the redraw if the text is unchanged."""
+        if self.progress_phrase and phrase != self._phrase_text:
+            self._phrase_text = phrase
+            self.progress_phrase.update(phrase)
     
     def _update_timer_display(self) -> None:
         """Update the elapsed time display."""
         if not self.progress_timer_display or not self.workflow_start_time:
             return
         
-        elapsed = time.time() - self.workflow_start_time
-        minutes = int(elapsed // 60)
-        seconds = int(elapsed % 60)
+        minutes, seconds = divmod(int(time.monotonic() - self.workflow_start_time), 60)
         
         if minutes > 0:
             time_str = f"[{minutes}m {seconds:02d}s]"
@@ -1210,7 +1236,7 @@ class FixxerTUI(App):
             self.timer_update_timer = None
         
         if self.workflow_start_time:
-            elapsed = time.time() - self.workflow_start_time
+            elapsed = time.monotonic() - self.workflow_start_time
             minutes = int(elapsed // 60)
             seconds = int(elapsed % 60)
             
@@ -1221,8 +1247,7 @@ class FixxerTUI(App):
             
             if self.spinner_display:
                 self.spinner_display.update("[bold green]✓[/bold green]")
-            if self.progress_phrase:
-                self.progress_phrase.update(f"✅ Completed in {time_str}")
+            self._set_phrase(f"✅ Completed in {time_str}")
             if self.progress_timer_display:
                 self.progress_timer_display.update("")
         
@@ -1232,8 +1257,7 @@ class FixxerTUI(App):
         """Reset spinner to ready state."""
         if self.spinner_display:
             self.spinner_display.update("")
-        if self.progress_phrase:
-            self.progress_phrase.update("Ready to process")
+        self._set_phrase("Ready to process")
         if self.progress_timer_display:
             self.progress_timer_display.update("")
     
@@ -1467,31 +1491,31 @@ class FixxerTUI(App):
         self.toggle_workflow_buttons(disabled=True)
 
         if event.button.id == "btn-auto":
-            self.write_to_log("=" * 50)
+            self.write_to_log(LOG_SEPARATOR)
             self.write_to_log("[bold cyan]Starting AUTO WORKFLOW[/bold cyan]")
             self.start_progress_tracking()
             self.run_in_thread(self.run_auto_workflow_thread, "AutoWorkflow")
 
         elif event.button.id == "btn-burst":
-            self.write_to_log("=" * 50)
+            self.write_to_log(LOG_SEPARATOR)
             self.write_to_log("[bold blue]Starting BURST GROUPING[/bold blue]")
             self.start_progress_tracking()
             self.run_in_thread(self.run_burst_workflow_thread, "BurstWorkflow")
         
         elif event.button.id == "btn-cull":
-            self.write_to_log("=" * 50)
+            self.write_to_log(LOG_SEPARATOR)
             self.write_to_log("[bold yellow]Starting CULL WORKFLOW[/bold yellow]")
             self.start_progress_tracking()
             self.run_in_thread(self.run_cull_workflow_thread, "CullWorkflow")
         
         elif event.button.id == "btn-stats":
-            self.write_to_log("=" * 50)
+            self.write_to_log(LOG_SEPARATOR)
             self.write_to_log("[bold magenta]Starting STATS ANALYSIS[/bold magenta]")
             self.start_progress_tracking()
             self.run_in_thread(self.run_stats_workflow_thread, "StatsWorkflow")
         
         elif event.button.id == "btn-critique":
-            self.write_to_log("=" * 50)
+            self.write_to_log(LOG_SEPARATOR)
             self.write_to_log("[bold cyan]Starting AI CRITIQUE[/bold cyan]")
             self.start_progress_tracking()
             self.run_in_thread(self.run_critique_workflow_thread, "CritiqueWorkflow")
@@ -1507,7 +1531,7 @@ class FixxerTUI(App):
             return
 
         self.toggle_workflow_buttons(disabled=True)
-        self.write_to_log("=" * 50)
+        self.write_to_log(LOG_SEPARATOR)
         self.write_to_log("[bold green]Starting EASY ARCHIVE[/bold green]")
         self.write_to_log("[dim]Simple AI naming + keyword folder organization[/dim]")
         self.start_progress_tracking()
@@ -1525,7 +1549,7 @@ class FixxerTUI(App):
 
         # Log cache usage
         cache_count = len(self.ai_cache)
-        self.write_to_log("=" * 50)
+        self.write_to_log(LOG_SEPARATOR)
         self.write_to_log(f"[cyan]⚡ Executing with {cache_count} cached AI names...[/cyan]")
 
         # Debug: Show cache keys
@@ -1596,12 +1620,14 @@ class FixxerTUI(App):
 
         # Write header
         with open(log_path, 'w') as f:
-            f.write("FIXXER DRY RUN LOG\n")
-            f.write(f"Timestamp: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-            f.write(f"Source: {self.app_config.get('last_source_path', 'N/A')}\n")
-            f.write(f"Destination: {self.app_config.get('last_destination_path', 'N/A')}\n")
-            f.write(f"Model: {self.app_config.get('default_model', 'N/A')}\n")
-            f.write("=" * 70 + "\n\n")
+            f.write(
+                "FIXXER DRY RUN LOG\n"
+                f"Timestamp: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
+                f"Source: {self.app_config.get('last_source_path', 'N/A')}\n"
+                f"Destination: {self.app_config.get('last_destination_path', 'N/A')}\n"
+                f"Model: {self.app_config.get('default_model', 'N/A')}\n"
+                f"{PREVIEW_LOG_RULE}\n\n"
+            )
 
         self.preview_log_path = log_path
         self.preview_log_buffer = []
@@ -1618,18 +1644,13 @@ class FixxerTUI(App):
         if not self.preview_log_path or not self.preview_log_buffer:
             return
 
-        import re
-
-        # Strip Rich markup
-        clean_buffer = []
-        for line in self.preview_log_buffer:
-            clean_line = re.sub(r'\[/?[a-z]+[^\]]*\]', '', line)
-            clean_buffer.append(clean_line)
+        # Strip Rich markup in one pass over the whole buffer
+        clean_text = RICH_MARKUP_RE.sub('', '\n'.join(self.preview_log_buffer))
 
         # Append to file
         with open(self.preview_log_path, 'a') as f:
-            f.write('\n'.join(clean_buffer))
-            f.write('\n\n' + '=' * 70 + '\n')
+            f.write(clean_text)
+            f.write(f"\n\n{PREVIEW_LOG_RULE}\n")
             f.write(f"Preview completed at {datetime.now().strftime('%H:%M:%S')}\n")
 
         self.write_to_log(f"\n[dim]📄 Preview log saved: {self.preview_log_path.name}[/dim]")
@@ -1647,11 +1668,11 @@ class FixxerTUI(App):
             return
 
         self.toggle_workflow_buttons(disabled=True)
-        self.write_to_log("=" * 50)
+        self.write_to_log(LOG_SEPARATOR)
         self.write_to_log("[bold yellow]🚫 PREVIEW MODE ENABLED 🚫[/bold yellow]")
         self.write_to_log(f"[bold yellow]Starting DRY RUN: {workflow.upper()}[/bold yellow]")
         self.write_to_log("[dim yellow]No files will be moved - preview only[/dim yellow]")
-        self.write_to_log("=" * 50)
+        self.write_to_log(LOG_SEPARATOR)
         self.start_progress_tracking()
 
         if workflow == "auto":
@@ -1789,12 +1810,12 @@ class FixxerTUI(App):
                         self.write_to_log("[red]✗ No source directory set.[/red]")
                         return
                     
-                    # Find first image file
-                    p = Path(source_path)
-                    for f in p.iterdir():
-                        if f.is_file() and f.suffix.lower() in SUPPORTED_EXTENSIONS:
-                            image_file = f
-                            break
+                    # Find first image file (scandir: no Path or stat for skipped entries)
+                    with os.scandir(source_path) as entries:
+                        for entry in entries:
+                            if entry.is_file() and os.path.splitext(entry.name)[1].lower() in SUPPORTED_EXTENSIONS:
+                                image_file = Path(entry.path)
+                                break
                 
                 if not image_file:
                     self.write_to_log("[red]✗ No images found in source directory.[/red]")
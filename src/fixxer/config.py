@@ -8,6 +8,8 @@ Application settings, defaults, and configuration file management.
 from __future__ import annotations
 
 import configparser
+import os
+import shutil
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, Any
@@ -18,8 +20,13 @@ from typing import Dict, Any
 
 # --- Ollama / AI Settings ---
 OLLAMA_URL = "http://localhost:11434/api/chat"
+OLLAMA_TAGS_URL = "http://localhost:11434/api/tags"
 DEFAULT_MODEL_NAME = "qwen2.5vl:3b"
 DEFAULT_CRITIQUE_MODEL = "qwen2.5vl:3b"
+# Decode cap for naming replies. A filename + 3 tags JSON is ~40 tokens; the
+# cap only stops runaway decodes. A reply cut off here is invalid JSON and the
+# image fails naming (it is not archived), so keep generous headroom.
+NAMING_MAX_TOKENS = 256
 
 # --- Path Settings ---
 DEFAULT_DESTINATION_BASE = Path.home() / "Pictures" / "FIXXER_Output"
@@ -180,27 +187,50 @@ def save_app_config(config: Dict[str, Any]) -> bool:
             pass
 
     # Ensure sections exist
-    if not parser.has_section('behavior'):
-        parser.add_section('behavior')
-    if not parser.has_section('ingest'):
-        parser.add_section('ingest')
+    changed = not CONFIG_FILE_PATH.exists()
+    for section in ('behavior', 'ingest'):
+        if not parser.has_section(section):
+            parser.add_section(section)
+            changed = True
+
+    def set_if_changed(section: str, key: str, value: str) -> None:
+        nonlocal changed
+        if parser.get(section, key, raw=True, fallback=None) != value:
+            parser.set(section, key, value)
+            changed = True
 
     # Save the key settings
     if 'last_source_path' in config and config['last_source_path']:
-        parser.set('behavior', 'last_source_path', str(config['last_source_path']))
+        set_if_changed('behavior', 'last_source_path', str(config['last_source_path']))
 
     if 'last_destination_path' in config and config['last_destination_path']:
-        parser.set('behavior', 'last_destination_path', str(config['last_destination_path']))
+        set_if_changed('behavior', 'last_destination_path', str(config['last_destination_path']))
 
     if 'default_model' in config and config['default_model']:
-        parser.set('ingest', 'default_model', str(config['default_model']))
+        set_if_changed('ingest', 'default_model', str(config['default_model']))
 
     if 'pro_mode' in config:
-        parser.set('behavior', 'pro_mode', 'true' if config['pro_mode'] else 'false')
+        set_if_changed('behavior', 'pro_mode', 'true' if config['pro_mode'] else 'false')
 
+    # Nothing to persist - skip rewriting the file
+    if not changed:
+        return True
+
+    # Write to a temp file and swap it in, so a crash mid-write can't truncate the config.
+    # Replace the resolved target so a symlinked (dotfiles) config stays a symlink,
+    # and carry over the existing file's permissions.
+    target_path = CONFIG_FILE_PATH.resolve()
+    tmp_path = target_path.with_name(target_path.name + '.tmp')
     try:
-        with open(CONFIG_FILE_PATH, 'w') as f:
+        with open(tmp_path, 'w') as f:
             parser.write(f)
+        if target_path.exists():
+            shutil.copymode(target_path, tmp_path)
+        os.replace(tmp_path, target_path)
         return True
     except Exception:
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
         return False
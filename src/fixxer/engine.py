@@ -18,10 +18,9 @@ from datetime import datetime, timedelta
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Optional, Tuple, List, Dict, Any, Callable
 from collections import defaultdict, Counter
+from functools import lru_cache
 from io import BytesIO
 import re
-import subprocess
-import sys
 import math
 
 # Import from new modules
@@ -55,8 +54,11 @@ from .vision import (
     encode_image,
     get_image_bytes_for_analysis,
     check_ollama_connection,
+    fetch_ollama_models,
+    preload_model,
     get_ai_description,
     get_ai_name_with_cache,
+    has_cached_ai_name,
     critique_single_image
 )
 
@@ -99,6 +101,8 @@ class StatsTracker:
         tracker.update('bursts', 42)
         tracker.stop_timer()
     """
+
+    __slots__ = ('callback', '_stats', '_start_time')
     
     def __init__(self, callback: Optional[Callable[[str, Any], None]] = None):
         """
@@ -131,16 +135,13 @@ class StatsTracker:
     
     def start_timer(self) -> None:
         """Start the workflow timer."""
-        self._start_time = datetime.now()
+        self._start_time = time.monotonic()
         self.update('time', 'Running...')
     
     def stop_timer(self) -> None:
         """Stop the timer and calculate human-readable duration."""
-        if self._start_time:
-            duration = datetime.now() - self._start_time
-            total_seconds = int(duration.total_seconds())
-            minutes = total_seconds // 60
-            seconds = total_seconds % 60
+        if self._start_time is not None:
+            minutes, seconds = divmod(int(time.monotonic() - self._start_time), 60)
             
             # Format: "2m 34s" (human-readable for quick glances)
             if minutes > 0:
@@ -193,8 +194,17 @@ def check_rawpy(log_callback: Callable[[str], None] = no_op_logger):
 
 def get_available_models(log_callback: Callable[[str], None] = no_op_logger) -> Optional[List[str]]:
     """Get list of available Ollama models."""
+    log_callback("   [grey]Checking Ollama connection...[/grey]")
+
+    # Ask the running server first; spawning `ollama list` costs a process launch
+    models = fetch_ollama_models()
+    if models is not None:
+        log_callback(f"   [green]✓ Ollama connected.[/green] Found {len(models)} models.")
+        return models
+
+    # Deferred: only needed when the HTTP API didn't answer
+    import subprocess
     try:
-        log_callback("   [grey]Checking Ollama connection...[/grey]")
         result = subprocess.run(['ollama', 'list'], capture_output=True, text=True, check=True)
         lines = result.stdout.strip().split('\n')[1:]
         models = [line.split()[0] for line in lines if line.strip()]
@@ -248,6 +258,28 @@ def get_unique_filename_simulated(base_name: str, extension: str, destination: P
             return filename
         counter += 1
 
+def _list_image_files(directory: Path) -> List[Path]:
+    """List supported image files directly inside a directory (one scandir pass)."""
+    with os.scandir(directory) as entries:
+        return [
+            Path(entry.path) for entry in entries
+            if entry.is_file() and os.path.splitext(entry.name)[1].lower() in SUPPORTED_EXTENSIONS
+        ]
+
+def _file_size(path: Path) -> int:
+    """Size of a file in bytes, or 0 if it can't be stat'd."""
+    try:
+        return path.stat().st_size
+    except OSError:
+        return 0
+
+def _entry_size(entry: os.DirEntry) -> int:
+    """Size of a scandir entry in bytes, or 0 if it can't be stat'd."""
+    try:
+        return entry.stat().st_size
+    except OSError:
+        return 0
+
 def format_duration(duration: timedelta) -> str:
     """Converts timedelta to readable string like '1d 4h 15m'"""
     total_seconds = int(duration.total_seconds())
@@ -273,16 +305,20 @@ def generate_bar_chart(data: dict, bar_width: int = 25, bar_char: str = "■") -
         output_lines.append(line)
     return output_lines
 
+_FILENAME_JUNK_RE = re.compile(r'[^\w\s-]')
+_FILENAME_SEP_RE = re.compile(r'[-\s]+')
+
 def clean_filename(description: str) -> str:
     """Convert AI description to clean filename"""
     clean = description.strip('"\'.,!?')
-    clean = re.sub(r'[^\w\s-]', '', clean)
-    clean = re.sub(r'[-\s]+', '-', clean)
+    clean = _FILENAME_JUNK_RE.sub('', clean)
+    clean = _FILENAME_SEP_RE.sub('-', clean)
     clean = clean.lower()[:60]
     return clean.strip('-')
 
+@lru_cache(maxsize=1024)
 def categorize_description(description: str) -> str:
-    """Determine category based on keywords in description"""
+    """Determine category based on keywords in description (memoized per description)"""
     description_lower = description.lower()
     category_scores = {}
     for category, keywords in GROUP_KEYWORDS.items():
@@ -293,34 +329,64 @@ def categorize_description(description: str) -> str:
         return max(category_scores, key=category_scores.get)
     return "Miscellaneous"
 
-def write_rename_log(log_path: Path, original_name: str, new_name: str, destination: Path):
+class RenameLog:
+    """(V9.3) Append-only rename log held open for a whole run.
+
+    Entries go through a single line-buffered handle guarded by a lock, so
+    worker threads share one file descriptor instead of reopening the log per
+    file, and every entry reaches disk as soon as it is written (this log is
+    the only undo record).
+    """
+
+    __slots__ = ('path', '_lock', '_fh')
+
+    def __init__(self, log_path: Path):
+        self.path = log_path
+        self._lock = threading.Lock()
+        self._fh = open(log_path, 'w', buffering=1)
+
+    def write(self, line: str):
+        with self._lock:
+            if not self._fh.closed:
+                self._fh.write(line)
+
+    def close(self):
+        with self._lock:
+            if not self._fh.closed:
+                self._fh.close()
+
+def write_rename_log(rename_log: Optional[RenameLog], original_name: str, new_name: str, destination: Path):
     """(V9.3) Append an AI rename operation to the log file."""
+    if rename_log is None:
+        return
     try:
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        log_entry = f"{timestamp} | {original_name} -> {new_name} | {destination}\n"
-        with open(log_path, 'a') as f:
-            f.write(log_entry)
+        rename_log.write(f"{timestamp} | {original_name} -> {new_name} | {destination}\n")
     except Exception:
         pass # Silent fail
 
-def initialize_rename_log(log_path: Path):
-    """(V9.3) Initialize the rename log file with a header."""
+def initialize_rename_log(log_path: Path) -> Optional[RenameLog]:
+    """(V9.3) Open the rename log for the run and write its header."""
     try:
+        rename_log = RenameLog(log_path)
         header = f"# FIXXER AI Rename Log - {SESSION_TIMESTAMP}\n"
         header += f"# Format: timestamp | original_name -> new_name | destination\n"
         header += "=" * 80 + "\n"
-        with open(log_path, 'w') as f:
-            f.write(header)
+        rename_log.write(header)
+        return rename_log
     except Exception:
-        pass
+        return None
 
 # ==============================================================================
 # V. AI & ANALYSIS MODULES (The "Brains")
 # ==============================================================================
 
+_PICK_RE = re.compile(r'_PICK\.\w+$', re.IGNORECASE)
+
 def is_already_ai_named(filename: str) -> bool:
     """(V9.2) Check if a PICK file already has an AI-generated name."""
-    if not re.search(r'_PICK\.\w+$', filename, re.IGNORECASE):
+    # Cheap substring test first; most filenames never reach the regex
+    if '_PICK.' not in filename.upper() or not _PICK_RE.search(filename):
         return False
     if filename.startswith('_PICK_'):
         return False
@@ -417,7 +483,7 @@ def process_single_image(
     image_path: Path,
     destination_base: Path,
     model_name: str,
-    rename_log_path: Optional[Path] = None,
+    rename_log: Optional[RenameLog] = None,
     log_callback: Callable[[str], None] = no_op_logger,
     preview_mode: bool = False,
     ai_cache: Optional[Dict[str, Dict]] = None,
@@ -448,8 +514,7 @@ def process_single_image(
                 # FIXXER v1.0: Hash-verified move
                 verify_file_move_with_hash(image_path, new_path, log_callback, generate_sidecar=True)
 
-            if rename_log_path:
-                write_rename_log(rename_log_path, image_path.name, new_path.name, destination_base)
+            write_rename_log(rename_log, image_path.name, new_path.name, destination_base)
             description_for_categorization = clean_base.replace('-', ' ')
             return image_path, True, new_path.name, description_for_categorization
 
@@ -473,8 +538,7 @@ def process_single_image(
             # FIXXER v1.0: Hash-verified move
             verify_file_move_with_hash(image_path, new_path, log_callback, generate_sidecar=True)
 
-        if rename_log_path:
-            write_rename_log(rename_log_path, image_path.name, new_path.name, destination_base)
+        write_rename_log(rename_log, image_path.name, new_path.name, destination_base)
 
         return image_path, True, new_path.name, description_for_categorization
     except Exception as e:
@@ -556,7 +620,7 @@ def simple_sort_workflow(
         ai_cache: Optional cache dict for AI results
         cache_lock: Optional threading.Lock for thread-safe cache access
     """
-    start_time = datetime.now()
+    start_time = time.monotonic()
 
     if app_config is None:
         app_config = load_app_config()
@@ -595,14 +659,8 @@ def simple_sort_workflow(
     log_callback(f"   Destination: {chosen_destination}")
     log_callback(f"   Model:       {chosen_model}")
 
-    # Get all image files (case-insensitive)
-    image_files = []
-    for ext in SUPPORTED_EXTENSIONS:
-        # Try both lowercase and uppercase
-        found_lower = list(directory.glob(f"*{ext}"))
-        found_upper = list(directory.glob(f"*{ext.upper()}"))
-        image_files.extend(found_lower)
-        image_files.extend(found_upper)
+    # Get all image files (case-insensitive, single directory pass)
+    image_files = _list_image_files(directory)
 
     if not image_files:
         log_callback("[yellow]No image files found in source directory.[/yellow]")
@@ -673,7 +731,7 @@ def simple_sort_workflow(
         except:
             pass
     
-    duration = datetime.now() - start_time
+    duration = timedelta(seconds=time.monotonic() - start_time)
     log_callback(f"\n[bold green]✓ Simple Sort Complete![/bold green]")
     log_callback(f"   Duration: {format_duration(duration)}")
     log_callback(f"   {success_count} images organized into folders")
@@ -755,11 +813,14 @@ def auto_workflow(
     if tracker:
         tracker.start_timer()
     
+    # The EXIF preview and burst stacking both see the untouched source folder; list it once
+    source_images = _list_image_files(directory)
+
     # --- 2. STATS PREVIEW ---
     log_callback("\n[bold]Step 2/5: Analyzing session (read-only)...[/bold]")
     try:
         if stop_event and stop_event.is_set(): return {}
-        show_exif_insights(log_callback, app_config, simulated=True, directory_override=directory, stop_event=stop_event)
+        show_exif_insights(log_callback, app_config, simulated=True, directory_override=directory, stop_event=stop_event, image_files=source_images)
     except Exception as e:
         log_callback(f"     [yellow]Could not run EXIF analysis: {e}[/yellow]")
 
@@ -773,7 +834,7 @@ def auto_workflow(
     auto_config['burst_auto_name'] = True
 
     # [FIX] Capture returned picks (dry-run feature)
-    burst_picks = group_bursts_in_directory(log_callback, auto_config, directory_override=directory, tracker=tracker, stop_event=stop_event, preview_mode=preview_mode, ai_cache=ai_cache, cache_lock=cache_lock)
+    burst_picks = group_bursts_in_directory(log_callback, auto_config, directory_override=directory, tracker=tracker, stop_event=stop_event, preview_mode=preview_mode, ai_cache=ai_cache, cache_lock=cache_lock, image_files=source_images)
 
     # --- 4. CULL SINGLES ---
     if stop_event and stop_event.is_set(): return {}
@@ -789,6 +850,7 @@ def auto_workflow(
     log_callback("\n[bold]Step 5/5: Finding and archiving 'hero' files...[/bold]")
 
     hero_files = []
+    hero_sizes: Dict[Path, int] = {}  # Sizes harvested during the scan (real runs)
 
     if preview_mode:
         # [CRITICAL FIX] In Dry Run, folders don't exist. Use the returned lists!
@@ -803,30 +865,37 @@ def auto_workflow(
                     hero_files.append(f)
         log_callback(f"   [dim]Preview: Found {len(hero_files)} hero files from returned lists[/dim]")
     else:
-        # [REAL RUN] Use existing filesystem scanning logic
+        # [REAL RUN] Scan with os.scandir so file sizes come from the same walk
         if tier_a_dir.is_dir():
-            for f in tier_a_dir.iterdir():
-                if f.is_file() and f.suffix.lower() in SUPPORTED_EXTENSIONS:
-                    hero_files.append(f)
+            with os.scandir(tier_a_dir) as entries:
+                for entry in entries:
+                    if entry.is_file() and os.path.splitext(entry.name)[1].lower() in SUPPORTED_EXTENSIONS:
+                        f = Path(entry.path)
+                        hero_files.append(f)
+                        hero_sizes[f] = _entry_size(entry)
 
         burst_parent = directory / "_Bursts"
-        burst_folders = []
-        if burst_parent.exists() and burst_parent.is_dir():
-            burst_folders = [f for f in burst_parent.iterdir() if f.is_dir()]
-
-        for burst_folder in burst_folders:
-            if burst_folder.is_dir():
-                for f in burst_folder.iterdir():
-                    if f.is_file() and (f.name.startswith(BEST_PICK_PREFIX) or is_already_ai_named(f.name)):
-                        hero_files.append(f)
+        if burst_parent.is_dir():
+            # Walk burst folders lazily; no need to materialize the folder list first
+            with os.scandir(burst_parent) as burst_folders:
+                for burst_folder in burst_folders:
+                    if not burst_folder.is_dir():
+                        continue
+                    with os.scandir(burst_folder.path) as entries:
+                        for entry in entries:
+                            if entry.is_file() and (entry.name.startswith(BEST_PICK_PREFIX) or is_already_ai_named(entry.name)):
+                                f = Path(entry.path)
+                                hero_files.append(f)
+                                hero_sizes[f] = _entry_size(entry)
 
     if not hero_files:
         log_callback(f"\n   No '{TIER_A_FOLDER}' or '_PICK_' files found. Nothing to archive.")
         log_callback("[bold green]✓ Auto workflow complete (no heroes found).[/bold green]")
         return {}
 
-    already_named = [f for f in hero_files if is_already_ai_named(f.name)]
-    needs_naming = [f for f in hero_files if not is_already_ai_named(f.name)]
+    already_named, needs_naming = [], []
+    for f in hero_files:
+        (already_named if is_already_ai_named(f.name) else needs_naming).append(f)
     log_callback(f"   Found {len(hero_files)} 'hero' files total:")
     if already_named:
         log_callback(f"     • {len(already_named)} already AI-named (from burst stacking)")
@@ -841,49 +910,66 @@ def auto_workflow(
     # [LOGIC PATCH] Only create the physical rename log if this is a REAL run
     if preview_mode:
         rename_log_path = None
+        rename_log = None
     else:
         rename_log_path = chosen_destination / f"_ai_rename_log_{SESSION_TIMESTAMP}.txt"
-        initialize_rename_log(rename_log_path)
+        rename_log = initialize_rename_log(rename_log_path)
 
     # Preview mode: track simulated paths for collision detection
     simulated_paths = set() if preview_mode else None
 
+    # Submit largest files first so the slowest AI calls don't straggle at the end
+    hero_files.sort(key=lambda f: hero_sizes[f] if f in hero_sizes else _file_size(f), reverse=True)
+
+    # Warm the model once so the workers don't all stall on the same cold load.
+    # Skip it when no model call will happen (all named, or all cached by a
+    # preview run): the preload pins the model in VRAM for its keep_alive.
+    if any(not has_cached_ai_name(f, chosen_model, ai_cache, cache_lock) for f in needs_naming):
+        log_callback(f"\n   [grey]Loading {chosen_model}...[/grey]")
+        preload_model(chosen_model, log_callback)
+
     log_callback(f"\n   [grey]Archiving {len(hero_files)} files...[/grey]")
-    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
-        future_to_file = {
-            executor.submit(
-                process_single_image,
-                img_path,
-                chosen_destination,
-                chosen_model,
-                rename_log_path,
-                log_callback,
-                preview_mode,
-                ai_cache,
-                cache_lock,
-                simulated_paths
-            ): img_path
-            for img_path in hero_files
-        }
+    # Close the rename log only after the executor has joined: workers still
+    # running when the user stops finish their moves and must log them
+    try:
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            future_to_file = {
+                executor.submit(
+                    process_single_image,
+                    img_path,
+                    chosen_destination,
+                    chosen_model,
+                    rename_log,
+                    log_callback,
+                    preview_mode,
+                    ai_cache,
+                    cache_lock,
+                    simulated_paths
+                ): img_path
+                for img_path in hero_files
+            }
+
+            for i, future in enumerate(as_completed(future_to_file)):
+                if stop_event and stop_event.is_set():
+                    log_callback("\n[yellow]🛑 Workflow stopped by user.[/yellow]")
+                    executor.shutdown(wait=False, cancel_futures=True)
+                    return {}
+
+                log_callback(f"   [grey]Processing item {i+1}/{len(hero_files)}...[/grey]")
+                original, success, message, description = future.result()
+                if success:
+                    results["success"].append({
+                        "original": original.name,
+                        "new_name": message,
+                        "description": description
+                    })
+                else:
+                    results["failed"].append((original.name, message))
+                    log_callback(f"   [red]✗ {original.name}: {message}[/red]")
+    finally:
+        if rename_log:
+            rename_log.close()
 
-        for i, future in enumerate(as_completed(future_to_file)):
-            if stop_event and stop_event.is_set():
-                log_callback("\n[yellow]🛑 Workflow stopped by user.[/yellow]")
-                executor.shutdown(wait=False, cancel_futures=True)
-                return {}
-
-            log_callback(f"   [grey]Processing item {i+1}/{len(hero_files)}...[/grey]")
-            original, success, message, description = future.result()
-            if success:
-                results["success"].append({
-                    "original": original.name,
-                    "new_name": message,
-                    "description": description
-                })
-            else:
-                results["failed"].append((original.name, message))
-                log_callback(f"   [red]✗ {original.name}: {message}[/red]")
-    
     log_callback(f"\n[green]✓ Successfully archived: {len(results['success'])}[/green]")
     log_callback(f"[red]✗ Failed to archive: {len(results['failed'])}[/red]")
     
@@ -897,10 +983,9 @@ def auto_workflow(
     }
 
     if results["success"]:
-        categories = {}
-        for item in results["success"]:
-            cat = categorize_description(item["description"])
-            categories[cat] = categories.get(cat, 0) + 1
+        categories = Counter(
+            categorize_description(item["description"]) for item in results["success"]
+        )
 
         # In preview mode, skip file organization (files not actually moved)
         if preview_mode:
@@ -949,7 +1034,8 @@ def group_bursts_in_directory(
     stop_event: Optional[threading.Event] = None,
     preview_mode: bool = False,
     ai_cache: Optional[Dict[str, Dict]] = None,
-    cache_lock: Optional[threading.Lock] = None
+    cache_lock: Optional[threading.Lock] = None,
+    image_files: Optional[List[Path]] = None
 ) -> List[Path]:
     """
     (V1.2) Finds and stacks burst groups, optionally AI-naming the best pick.
@@ -963,6 +1049,8 @@ def group_bursts_in_directory(
 
     New in dry-run feature:
         preview_mode: If True, simulate operations without moving files
+
+    image_files: Images already listed by the caller (auto workflow); scanned here if None
     """
     
     if app_config is None: app_config = load_app_config()
@@ -988,10 +1076,8 @@ def group_bursts_in_directory(
     log_callback(f"[grey]Scanning for bursts in: {directory.name}[/grey]")
     burst_threshold = app_config['burst_threshold']
     
-    image_files = [
-        f for f in directory.iterdir() 
-        if f.is_file() and f.suffix.lower() in SUPPORTED_EXTENSIONS
-    ]
+    if image_files is None:
+        image_files = _list_image_files(directory)
     if len(image_files) < 2:
         log_callback("   Not enough images to compare.")
         return
@@ -999,15 +1085,21 @@ def group_bursts_in_directory(
     all_hashes = {}
     log_callback(f"   [grey]Calculating {len(image_files)} visual fingerprints...[/grey]")
     
+    # Report progress in ~10% steps rather than one log line per image
+    total = len(image_files)
+    report_step = max(1, total // 10)
+    next_report = report_step
     with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
         future_to_path = {executor.submit(get_image_hash, path, log_callback): path for path in image_files}
-        for i, future in enumerate(as_completed(future_to_path)):
+        for done, future in enumerate(as_completed(future_to_path), 1):
             if stop_event and stop_event.is_set():
                 log_callback("\n[yellow]🛑 Workflow stopped by user.[/yellow]")
                 executor.shutdown(wait=False, cancel_futures=True)
                 return
                 
-            log_callback(f"   [grey]Hashing image {i+1}/{len(image_files)}...[/grey]",)
+            if done >= next_report or done == total:
+                log_callback(f"   [grey]Hashing image {done}/{total}...[/grey]")
+                next_report += report_step
             path, img_hash = future.result()
             if img_hash:
                 all_hashes[path] = img_hash
@@ -1046,18 +1138,27 @@ def group_bursts_in_directory(
     # Track burst picks for return value (dry-run feature)
     burst_picks: List[Path] = []
 
+    # Score every burst member in parallel (decode + OpenCV release the GIL),
+    # then pick per group in original order so ties resolve as before
+    def score_sharpness(file_path: Path) -> Optional[float]:
+        image_bytes = get_image_bytes_for_analysis(file_path, log_callback)
+        if not image_bytes:
+            return None
+        return analyze_image_quality(image_bytes).get('sharpness', 0.0)
+
+    burst_members = [file_path for group in all_burst_groups for file_path in group]
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        sharpness_by_path = dict(zip(burst_members, executor.map(score_sharpness, burst_members), strict=True))
+
     best_picks: Dict[int, Tuple[Path, float]] = {}
     for i, group in enumerate(all_burst_groups):
         best_sharpness = -1.0
         best_file = None
         for file_path in group:
-            image_bytes = get_image_bytes_for_analysis(file_path, log_callback)
-            if image_bytes:
-                scores = analyze_image_quality(image_bytes)
-                sharpness = scores.get('sharpness', 0.0)
-                if sharpness > best_sharpness:
-                    best_sharpness = sharpness
-                    best_file = file_path
+            sharpness = sharpness_by_path[file_path]
+            if sharpness is not None and sharpness > best_sharpness:
+                best_sharpness = sharpness
+                best_file = file_path
         if best_file:
             best_picks[i] = (best_file, best_sharpness)
 
@@ -1071,79 +1172,87 @@ def group_bursts_in_directory(
     # v1.1: Check if AI naming is enabled for burst workflow
     burst_auto_name = app_config.get('burst_auto_name', False)
 
+    rename_log: Optional[RenameLog] = None
+    rename_log_path: Optional[Path] = None
     if burst_auto_name:
         # [LOGIC PATCH] Only create the physical rename log if this is a REAL run
         if preview_mode:
             rename_log_path = None
+            rename_log = None
         else:
             rename_log_path = directory / f"_ai_rename_log_{SESSION_TIMESTAMP}.txt"
-            initialize_rename_log(rename_log_path)
+            rename_log = initialize_rename_log(rename_log_path)
         ai_model = app_config.get('default_model', DEFAULT_MODEL_NAME)
         log_callback("   [grey]AI naming enabled for bursts...[/grey]")
 
-    for i, group in enumerate(all_burst_groups):
-        winner_data = best_picks.get(i)
-        sample_image = winner_data[0] if winner_data else group[0]
-
-        # Add the winner to our return list (for dry-run feature)
-        burst_picks.append(sample_image)
-
-        # Only run AI naming if enabled
-        if burst_auto_name:
-            log_callback(f"   [grey]Burst {i+1}/{len(all_burst_groups)}: Naming...[/grey]")
-
-            # Use cache-aware AI naming (for dry-run feature)
-            ai_filename, ai_tags = get_ai_name_with_cache(
-                sample_image, ai_model, ai_cache, cache_lock, log_callback
-            )
-
-            if ai_filename and ai_tags:
-                base_name = Path(ai_filename).stem  # Extract base name without extension
-                folder_name = f"{base_name}_burst"
-                log_callback(f"     [green]✓ AI named:[/green] {base_name}")
+    # Close the rename log even if naming/moving raises partway through
+    try:
+        for i, group in enumerate(all_burst_groups):
+            winner_data = best_picks.get(i)
+            sample_image = winner_data[0] if winner_data else group[0]
+
+            # Add the winner to our return list (for dry-run feature)
+            burst_picks.append(sample_image)
+
+            # Only run AI naming if enabled
+            if burst_auto_name:
+                log_callback(f"   [grey]Burst {i+1}/{len(all_burst_groups)}: Naming...[/grey]")
+
+                # Use cache-aware AI naming (for dry-run feature)
+                ai_filename, ai_tags = get_ai_name_with_cache(
+                    sample_image, ai_model, ai_cache, cache_lock, log_callback
+                )
+
+                if ai_filename and ai_tags:
+                    base_name = Path(ai_filename).stem  # Extract base name without extension
+                    folder_name = f"{base_name}_burst"
+                    log_callback(f"     [green]✓ AI named:[/green] {base_name}")
+                else:
+                    base_name = f"burst-{i+1:03d}"
+                    folder_name = base_name
+                    log_callback(f"     [yellow]⚠️ AI naming failed, using:[/yellow] {base_name}")
             else:
+                # Fast mode: Just use numeric naming
                 base_name = f"burst-{i+1:03d}"
                 folder_name = base_name
-                log_callback(f"     [yellow]⚠️ AI naming failed, using:[/yellow] {base_name}")
-        else:
-            # Fast mode: Just use numeric naming
-            base_name = f"burst-{i+1:03d}"
-            folder_name = base_name
-            log_callback(f"   [grey]Burst {i+1}/{len(all_burst_groups)}: {folder_name} ({len(group)} files)[/grey]")
+                log_callback(f"   [grey]Burst {i+1}/{len(all_burst_groups)}: {folder_name} ({len(group)} files)[/grey]")
         
-        folder_path = bursts_parent / folder_name
-        if folder_path.exists():
-            counter = 2
-            original_name = folder_name
-            while folder_path.exists():
-                folder_name = f"{original_name}-{counter}"
-                folder_path = bursts_parent / folder_name
-                counter += 1
+            folder_path = bursts_parent / folder_name
+            if folder_path.exists():
+                counter = 2
+                original_name = folder_name
+                while folder_path.exists():
+                    folder_name = f"{original_name}-{counter}"
+                    folder_path = bursts_parent / folder_name
+                    counter += 1
         
-        log_callback(f"     [grey]📁 Moving {len(group)} files to {folder_path.relative_to(directory)}/...[/grey]")
-        if not preview_mode:
-            folder_path.mkdir(parents=True, exist_ok=True)
+            log_callback(f"     [grey]📁 Moving {len(group)} files to {folder_path.relative_to(directory)}/...[/grey]")
+            if not preview_mode:
+                folder_path.mkdir(parents=True, exist_ok=True)
         
-        alternate_counter = 1
-        for file_path in group:
-            extension = file_path.suffix
-            if winner_data and file_path == winner_data[0]:
-                new_name = f"{base_name}_PICK{extension}"
-            else:
-                new_name = f"{base_name}_{alternate_counter:03d}{extension}"
-                alternate_counter += 1
-            
-            new_file_path = folder_path / new_name
-            try:
-                if preview_mode:
-                    log_callback(f"     [cyan]WOULD MOVE:[/cyan] {file_path.name} → {folder_path.name}/{new_name}")
+            alternate_counter = 1
+            for file_path in group:
+                extension = file_path.suffix
+                if winner_data and file_path == winner_data[0]:
+                    new_name = f"{base_name}_PICK{extension}"
                 else:
-                    # FIXXER v1.0: Hash-verified move
-                    verify_file_move_with_hash(file_path, new_file_path, log_callback, generate_sidecar=True)
-                if burst_auto_name:
-                    write_rename_log(rename_log_path, file_path.name, new_name, folder_path)
-            except Exception as e:
-                log_callback(f"     [red]FAILED to move {file_path.name}: {e}[/red]")
+                    new_name = f"{base_name}_{alternate_counter:03d}{extension}"
+                    alternate_counter += 1
+            
+                new_file_path = folder_path / new_name
+                try:
+                    if preview_mode:
+                        log_callback(f"     [cyan]WOULD MOVE:[/cyan] {file_path.name} → {folder_path.name}/{new_name}")
+                    else:
+                        # FIXXER v1.0: Hash-verified move
+                        verify_file_move_with_hash(file_path, new_file_path, log_callback, generate_sidecar=True)
+                    if burst_auto_name:
+                        write_rename_log(rename_log, file_path.name, new_name, folder_path)
+                except Exception as e:
+                    log_callback(f"     [red]FAILED to move {file_path.name}: {e}[/red]")
+    finally:
+        if rename_log:
+            rename_log.close()
 
     if burst_auto_name and rename_log_path:
         log_callback(f"   Rename log saved: {rename_log_path.name}")
@@ -1192,10 +1301,7 @@ def cull_images_in_directory(
     
     log_callback(f"[grey]Analyzing technical quality in: {directory.name}[/grey]")
 
-    image_files = [
-        f for f in directory.iterdir() 
-        if f.is_file() and f.suffix.lower() in SUPPORTED_EXTENSIONS
-    ]
+    image_files = _list_image_files(directory)
     if not image_files:
         log_callback("     No supported images to analyze.")
         return
@@ -1203,18 +1309,23 @@ def cull_images_in_directory(
     all_scores = {}
     log_callback(f"   [grey]Analyzing sharpness/exposure for {len(image_files)} images...[/grey]")
 
+    total = len(image_files)
+    report_step = max(1, total // 10)
+    next_report = report_step
     with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
         future_to_path = {
             executor.submit(process_image_for_culling, path, log_callback): path 
             for path in image_files
         }
-        for i, future in enumerate(as_completed(future_to_path)):
+        for done, future in enumerate(as_completed(future_to_path), 1):
             if stop_event and stop_event.is_set():
                 log_callback("\n[yellow]🛑 Workflow stopped by user.[/yellow]")
                 executor.shutdown(wait=False, cancel_futures=True)
                 return
 
-            log_callback(f"   [grey]Analyzing image {i+1}/{len(image_files)}...[/grey]")
+            if done >= next_report or done == total:
+                log_callback(f"   [grey]Analyzing image {done}/{total}...[/grey]")
+                next_report += report_step
             path, scores = future.result()
             if scores:
                 all_scores[path] = scores
@@ -1285,12 +1396,26 @@ def process_image_for_culling(image_path: Path, log_callback: Callable[[str], No
 
 # --- Stats Workflow ---
 
+LIGHTING_TABLE = {
+    (0, 4):   "Night", (5, 7):   "Golden Hour (AM)", (8, 10):  "Morning",
+    (11, 13): "Midday", (14, 16): "Afternoon", (17, 18): "Golden Hour (PM)",
+    (19, 21): "Dusk", (22, 23): "Night",
+}
+
+# Hour-of-day -> lighting bucket, built once so classification is a single index
+_HOUR_LUT: List[str] = [""] * 24
+for (_start, _end), _name in LIGHTING_TABLE.items():
+    for _hour in range(_start, _end + 1):
+        _HOUR_LUT[_hour] = _name
+del _start, _end, _name, _hour
+
 def show_exif_insights(
     log_callback: Callable[[str], None] = no_op_logger,
     app_config: Optional[Dict[str, Any]] = None,
     simulated: bool = False,
     directory_override: Optional[Path] = None,
-    stop_event: Optional[threading.Event] = None
+    stop_event: Optional[threading.Event] = None,
+    image_files: Optional[List[Path]] = None
 ) -> None:
     """(V6.4) Scans images, aggregates EXIF data, prints summary"""
     
@@ -1315,10 +1440,8 @@ def show_exif_insights(
         
     log_callback(f"[grey]Scanning EXIF data in: {directory.name}[/grey]")
     
-    image_files = [
-        f for f in directory.iterdir() 
-        if f.is_file() and f.suffix.lower() in SUPPORTED_EXTENSIONS
-    ]
+    if image_files is None:
+        image_files = _list_image_files(directory)
     if not image_files:
         log_callback("     No supported images to analyze.")
         return
@@ -1326,19 +1449,23 @@ def show_exif_insights(
     all_stats = []
     log_callback(f"   [grey]Reading EXIF data from {len(image_files)} files...[/grey]")
 
+    total = len(image_files)
+    report_step = max(1, total // 10)
+    next_report = report_step
     with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
         future_to_path = {
             executor.submit(analyze_single_exif, path): path 
             for path in image_files
         }
-        for i, future in enumerate(as_completed(future_to_path)):
+        for done, future in enumerate(as_completed(future_to_path), 1):
             if stop_event and stop_event.is_set():
                 log_callback("\n[yellow]🛑 Workflow stopped by user.[/yellow]")
                 executor.shutdown(wait=False, cancel_futures=True)
                 return
 
-            if not simulated:
-                log_callback(f"   [grey]Scanning image {i+1}/{len(image_files)}...[/grey]")
+            if not simulated and (done >= next_report or done == total):
+                log_callback(f"   [grey]Scanning image {done}/{total}...[/grey]")
+                next_report += report_step
             result_dict = future.result()
             if result_dict:
                 all_stats.append(result_dict)
@@ -1354,25 +1481,10 @@ def show_exif_insights(
     end_time = timestamps[-1]
     duration_str = format_duration(end_time - start_time)
 
-    LIGHTING_TABLE = {
-        (0, 4):   "Night", (5, 7):   "Golden Hour (AM)", (8, 10):  "Morning",
-        (11, 13): "Midday", (14, 16): "Afternoon", (17, 18): "Golden Hour (PM)",
-        (19, 21): "Dusk", (22, 23): "Night",
-    }
-    lighting_buckets = defaultdict(int)
-    camera_counter = Counter()
-    focal_len_counter = Counter()
-    aperture_counter = Counter()
-
-    for stats in all_stats:
-        hour = stats['timestamp'].hour
-        for (start, end), name in LIGHTING_TABLE.items():
-            if start <= hour <= end:
-                lighting_buckets[name] += 1
-                break
-        camera_counter[stats['camera']] += 1
-        focal_len_counter[stats['focal_length']] += 1
-        aperture_counter[stats['aperture']] += 1
+    lighting_buckets = Counter(_HOUR_LUT[s['timestamp'].hour] for s in all_stats)
+    camera_counter = Counter(s['camera'] for s in all_stats)
+    focal_len_counter = Counter(s['focal_length'] for s in all_stats)
+    aperture_counter = Counter(s['aperture'] for s in all_stats)
 
     # --- Display Results to Log ---
     log_callback("\n[bold]📖 Session Story:[/bold]")
@@ -15,6 +15,7 @@ Distribution:
 """
 
 import random
+from collections import deque
 from typing import List
 
 # ============================================================================
@@ -312,13 +313,37 @@ VISIONCREW_META_PHRASES = [
     "🎭 We live in a society.",
 ]
 
+# ============================================================================
+# QUIT MESSAGES
+# ============================================================================
+
+QUIT_MESSAGES = (
+    "👋 LOGGING OFF...",
+    "💀 CONNECTION TERMINATED.",
+    "🔌 PULLING THE PLUG.",
+    "💾 NO CARRIER.",
+    "👋 KTHXBYE.",
+)
+
 # ============================================================================
 # PHRASE SELECTION LOGIC
 # ============================================================================
 
 # v8.0 GM: Track recently shown phrases to avoid repetition
-_recent_phrases = []
 _MAX_RECENT = 15  # Bumped up memory to avoid repeats
+_recent_phrases = deque(maxlen=_MAX_RECENT)
+
+# Duration tiers as (upper bound in minutes, pool, pool + meta), built once
+_PHRASE_TIERS = tuple(
+    (limit, pool, pool + VISIONCREW_META_PHRASES)
+    for limit, pool in (
+        (5, QUICK_PROCESSING_PHRASES),
+        (15, EARLY_PROCESSING_PHRASES),
+        (30, MID_PROCESSING_PHRASES),
+        (60, LONG_PROCESSING_PHRASES),
+        (float('inf'), MARATHON_PROCESSING_PHRASES),
+    )
+)
 
 
 def get_phrase_by_duration(elapsed_seconds: float, use_meta: bool = False) -> str:
@@ -333,25 +358,14 @@ def get_phrase_by_duration(elapsed_seconds: float, use_meta: bool = False) -> st
     Returns:
         Random phrase from appropriate duration tier (avoiding recent repeats)
     """
-    global _recent_phrases
-    
     elapsed_minutes = elapsed_seconds / 60
     
-    # Determine which phrase pool to use
-    if elapsed_minutes < 5:
-        pool = QUICK_PROCESSING_PHRASES
-    elif elapsed_minutes < 15:
-        pool = EARLY_PROCESSING_PHRASES
-    elif elapsed_minutes < 30:
-        pool = MID_PROCESSING_PHRASES
-    elif elapsed_minutes < 60:
-        pool = LONG_PROCESSING_PHRASES
-    else:
-        pool = MARATHON_PROCESSING_PHRASES
-    
-    # Add meta phrases if we're in loading/waiting context
-    if use_meta:
-        pool = pool + VISIONCREW_META_PHRASES
+    # Determine which phrase pool to use (meta phrases only in loading/waiting context)
+    for limit, pool, pool_with_meta in _PHRASE_TIERS:
+        if elapsed_minutes < limit:
+            if use_meta:
+                pool = pool_with_meta
+            break
     
     # v8.0 GM: Filter out recently shown phrases for variety
     available_phrases = [p for p in pool if p not in _recent_phrases]
@@ -364,10 +378,8 @@ def get_phrase_by_duration(elapsed_seconds: float, use_meta: bool = False) -> st
     # Select random phrase from available pool
     selected = random.choice(available_phrases)
     
-    # Track this phrase to avoid repetition
+    # Track this phrase to avoid repetition (deque drops the oldest)
     _recent_phrases.append(selected)
-    if len(_recent_phrases) > _MAX_RECENT:
-        _recent_phrases.pop(0)  # Remove oldest phrase
     
     return selected
 
@@ -379,13 +391,6 @@ def get_model_loading_phrase() -> str:
 
 def get_quit_message() -> str:
     """Get a random quit message."""
-    QUIT_MESSAGES = [
-        "👋 LOGGING OFF...",
-        "💀 CONNECTION TERMINATED.",
-        "🔌 PULLING THE PLUG.",
-        "💾 NO CARRIER.",
-        "👋 KTHXBYE.",
-    ]
     return random.choice(QUIT_MESSAGES)
 
 
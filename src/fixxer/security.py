@@ -133,8 +133,10 @@ def write_sidecar_file(
             metadata["sha256_destination"] = dest_hash
             metadata["corruption_detected"] = True
 
+        # Serialize up front so the sidecar lands in a single write() call
+        payload = json.dumps(metadata, indent=2)
         with open(sidecar_path, 'w', encoding='utf-8') as f:
-            json.dump(metadata, f, indent=2)
+            f.write(payload)
 
         return True
 
@@ -11,20 +11,36 @@ from __future__ import annotations
 
 import base64
 import json
+import mmap
+import os
 import re
 import time
 import threading
+from collections import OrderedDict
 import requests
+from requests.adapters import HTTPAdapter
 from pathlib import Path
 from io import BytesIO
-from typing import Optional, Tuple, List, Dict, Any, Callable
+from typing import Optional, Tuple, List, Dict, Any, Callable, Iterator
+
+# Optional SIMD base64 (several times faster on multi-MB images); stdlib fallback
+try:
+    import pybase64
+    _b64encode = pybase64.b64encode
+    PYBASE64_AVAILABLE = True
+except ImportError:
+    _b64encode = base64.b64encode
+    PYBASE64_AVAILABLE = False
 
 # Import config module (for mutable RAW_SUPPORT)
 from . import config
 from .config import (
     OLLAMA_URL,
+    OLLAMA_TAGS_URL,
     INGEST_TIMEOUT,
-    CRITIQUE_TIMEOUT
+    CRITIQUE_TIMEOUT,
+    NAMING_MAX_TOKENS,
+    MAX_WORKERS
 )
 
 
@@ -32,6 +48,19 @@ from .config import (
 # AI PROMPTS
 # ==============================================================================
 
+AI_NAMING_PROMPT = """You are an expert file-naming AI.
+Analyze this image and generate a concise, descriptive filename and three relevant tags.
+You MUST return ONLY a single, valid JSON object, formatted *exactly* like this:
+{
+  "filename": "<a-concise-and-descriptive-filename>",
+  "tags": ["<tag1>", "<tag2>", "<tag3>"]
+}
+"""
+
+# User turn that carries the image. The task prompt goes in the system turn
+# ahead of it, so every request shares the same token prefix.
+AI_IMAGE_TURN = "Here is the image."
+
 AI_CRITIC_PROMPT = """
 You are a professional Creative Director and magazine photo editor. Your job is to provide ambitious, artistic, and creative feedback to elevate a photo from "good" to "great."
 
@@ -63,6 +92,37 @@ After your analysis, you MUST return **ONLY a single, valid JSON object**. Do no
 """
 
 
+# JSON Schemas passed as Ollama's "format": decoding is grammar-constrained to
+# these shapes, so replies always parse and carry every required key.
+# Requires Ollama 0.5.0+ (structured outputs); older servers reject a schema
+# "format" with HTTP 400. The default qwen2.5vl models need a newer server anyway.
+NAMING_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "filename": {"type": "string"},
+        "tags": {"type": "array", "items": {"type": "string"}}
+    },
+    "required": ["filename", "tags"]
+}
+
+CRITIQUE_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "composition_score": {"type": "integer"},
+        "composition_critique": {"type": "string"},
+        "lighting_critique": {"type": "string"},
+        "color_critique": {"type": "string"},
+        "final_verdict": {"type": "string"},
+        "creative_mood": {"type": "string"},
+        "creative_suggestion": {"type": "string"}
+    },
+    "required": [
+        "composition_score", "composition_critique", "lighting_critique",
+        "color_critique", "final_verdict", "creative_mood", "creative_suggestion"
+    ]
+}
+
+
 # ==============================================================================
 # HELPER FUNCTIONS
 # ==============================================================================
@@ -72,6 +132,25 @@ def no_op_logger(message: str) -> None:
     pass
 
 
+def _strip_markdown_fences(text: str) -> str:
+    """
+    Remove a surrounding ```json ... ``` fence from a model response.
+
+    Everything after the last fence (trailing prose such as "Let me know...")
+    is dropped too, while backticks inside the JSON body are left alone.
+
+    Args:
+        text: Raw message content from the model
+
+    Returns:
+        The unfenced, stripped content
+    """
+    text = text.strip()
+    if text.startswith("```"):
+        text = text[3:].removeprefix("json").rsplit("```", 1)[0]
+    return text.strip()
+
+
 # ==============================================================================
 # RAW FILE CONVERSION
 # ==============================================================================
@@ -162,35 +241,110 @@ def convert_raw_to_jpeg(raw_path: Path, log_callback: Callable[[str], None] = no
         return None
 
 
-def encode_image(image_path: Path, log_callback: Callable[[str], None] = no_op_logger) -> Optional[str]:
+def _b64encode_file(image_path: Path) -> bytes:
     """
-    Convert image to base64 string, handling RAW files.
+    Base64-encode a file straight from a read-only memory map.
+
+    The encoder reads the mapped pages directly, so no intermediate bytes
+    object is built for the file contents; only the encoding is allocated.
+    A sequential-access hint lets the kernel read ahead aggressively.
+
+    Args:
+        image_path: Path to file
+
+    Returns:
+        Base64-encoded ASCII bytes
+    """
+    with open(image_path, 'rb') as img_file:
+        if os.fstat(img_file.fileno()).st_size == 0:
+            return b""  # mmap can't map an empty file
+        with mmap.mmap(img_file.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if hasattr(mmap, 'MADV_SEQUENTIAL'):
+                mm.madvise(mmap.MADV_SEQUENTIAL)
+            return _b64encode(mm)
+
+
+# Recent critique encodings keyed by (path, mtime_ns, size). Re-critiquing the
+# same shot skips the read + encode (and the RAW demosaic); an edited file gets
+# a new key. Batch naming never uses it (ai_cache already prevents repeats), and
+# the total is byte-capped so an idle TUI doesn't pin big encodings.
+_ENCODE_CACHE_MAX_BYTES = 64 * 1024 * 1024
+_encode_cache: "OrderedDict[Tuple[str, int, int], bytes]" = OrderedDict()
+_encode_cache_bytes = 0
+_encode_cache_lock = threading.Lock()
+
+
+def _encode_image_b64(
+    image_path: Path,
+    log_callback: Callable[[str], None] = no_op_logger,
+    use_cache: bool = False
+) -> Optional[bytes]:
+    """
+    Base64-encode an image (RAW files via their JPEG preview) as ASCII bytes.
+
+    The Ollama request paths splice these bytes straight into the request
+    body, so the encoding is never decoded into a str copy.
 
     Args:
         image_path: Path to image file (JPEG, PNG, or RAW)
         log_callback: Optional logging function
+        use_cache: Reuse/keep the encoding in the small critique cache
 
     Returns:
-        Base64-encoded string, or None on failure
+        Base64-encoded bytes, or None on failure
     """
+    global _encode_cache_bytes
     try:
+        key = None
+        if use_cache:
+            st = image_path.stat()
+            key = (str(image_path), st.st_mtime_ns, st.st_size)
+            with _encode_cache_lock:
+                cached = _encode_cache.get(key)
+                if cached is not None:
+                    _encode_cache.move_to_end(key)
+                    return cached
+
         # All RAW formats supported by rawpy
         raw_formats = {'.rw2', '.cr2', '.cr3', '.nef', '.arw', '.dng', '.raf', '.orf', '.pef', '.srw'}
         if image_path.suffix.lower() in raw_formats:
             jpeg_bytes = convert_raw_to_jpeg(image_path, log_callback)
-            if jpeg_bytes:
-                return base64.b64encode(jpeg_bytes).decode('utf-8')
-            else:
+            if not jpeg_bytes:
                 return None
-
-        with open(image_path, 'rb') as img_file:
-            return base64.b64encode(img_file.read()).decode('utf-8')
+            encoded = _b64encode(jpeg_bytes)
+        else:
+            encoded = _b64encode_file(image_path)
+
+        if key is not None and len(encoded) <= _ENCODE_CACHE_MAX_BYTES:
+            with _encode_cache_lock:
+                if key not in _encode_cache:
+                    _encode_cache[key] = encoded
+                    _encode_cache_bytes += len(encoded)
+                while _encode_cache_bytes > _ENCODE_CACHE_MAX_BYTES:
+                    _, evicted = _encode_cache.popitem(last=False)
+                    _encode_cache_bytes -= len(evicted)
+        return encoded
 
     except Exception as e:
         log_callback(f"   [red]Error encoding {image_path.name}:[/red] {e}")
         return None
 
 
+def encode_image(image_path: Path, log_callback: Callable[[str], None] = no_op_logger) -> Optional[str]:
+    """
+    Convert image to base64 string, handling RAW files.
+
+    Args:
+        image_path: Path to image file (JPEG, PNG, or RAW)
+        log_callback: Optional logging function
+
+    Returns:
+        Base64-encoded string, or None on failure
+    """
+    encoded = _encode_image_b64(image_path, log_callback)
+    return encoded.decode('ascii') if encoded is not None else None
+
+
 def get_image_bytes_for_analysis(image_path: Path, log_callback: Callable[[str], None] = no_op_logger) -> Optional[bytes]:
     """
     Helper to get bytes from any supported file.
@@ -217,6 +371,79 @@ def get_image_bytes_for_analysis(image_path: Path, log_callback: Callable[[str],
     return None
 
 
+# ==============================================================================
+# OLLAMA HTTP SESSION
+# ==============================================================================
+
+# Shared keep-alive session: every Ollama call reuses pooled connections to
+# localhost instead of opening a fresh TCP connection per image. The pool is
+# sized to the worker count so concurrent naming calls never fall back to
+# throwaway connections.
+_SESSION = requests.Session()
+_SESSION.mount("http://", HTTPAdapter(pool_connections=1, pool_maxsize=MAX_WORKERS))
+
+# Last /api/tags model listing as (monotonic timestamp, names). The installed
+# set only changes on `ollama pull`/`rm`, so a short TTL avoids re-querying
+# between the startup check and the model picker.
+MODELS_CACHE_TTL = 30.0
+_models_cache: Optional[Tuple[float, List[str]]] = None
+
+# Image placeholder spliced out of the serialized chat payload (see below)
+_IMAGE_SLOT = "\x00fixxer-image\x00"
+_JSON_HEADERS = {"Content-Type": "application/json"}
+_BODY_CHUNK = 1 << 20
+
+
+def _chat_request_body(
+    model_name: str,
+    prompt: str,
+    base64_image: bytes,
+    response_format: Any = "json",
+    options: Optional[Dict[str, Any]] = None
+) -> Iterator[bytes]:
+    """
+    Stream a non-streaming /api/chat request body around a base64 image.
+
+    Passing json= to requests serializes the whole payload to a str and then
+    encodes it to bytes, holding two extra copies of a multi-MB image per
+    in-flight request. Base64 needs no JSON escaping, so the envelope is
+    serialized with a placeholder and the image is sent in ASCII slices
+    between the two halves (chunked transfer encoding).
+
+    The fixed task prompt is sent as the system turn, before the image.
+    Ollama reuses the cached KV prefix a new request shares with the last
+    one, so the prompt is prefilled once per model load rather than once
+    per image (with the image first, the prefix diverged immediately).
+
+    Args:
+        model_name: Ollama model to use
+        prompt: Task instructions (system message text)
+        base64_image: Base64-encoded image (ASCII bytes)
+        response_format: Ollama "format" value ("json" or a JSON Schema dict)
+        options: Optional Ollama runtime options (e.g. num_predict)
+
+    Returns:
+        Iterator over the request body in byte chunks
+    """
+    payload = {
+        "model": model_name,
+        "messages": [
+            { "role": "system", "content": prompt },
+            { "role": "user", "content": AI_IMAGE_TURN, "images": [_IMAGE_SLOT] }
+        ],
+        "stream": False,
+        "format": response_format
+    }
+    if options:
+        payload["options"] = options
+    envelope = json.dumps(payload)
+    head, _, tail = envelope.partition(json.dumps(_IMAGE_SLOT))
+    yield f'{head}"'.encode('utf-8')
+    for start in range(0, len(base64_image), _BODY_CHUNK):
+        yield base64_image[start:start + _BODY_CHUNK]
+    yield f'"{tail}'.encode('utf-8')
+
+
 # ==============================================================================
 # OLLAMA CONNECTION CHECK
 # ==============================================================================
@@ -244,11 +471,10 @@ def check_ollama_connection(
         # Line 1: The Search
         log_callback("   [grey]Looking for llamas 🔎🦙[/grey]")
 
-        response = requests.get("http://localhost:11434/api/tags", timeout=3)
+        response = _SESSION.get(OLLAMA_TAGS_URL, timeout=3)
 
         if response.status_code == 200:
-            data = response.json()
-            models = data.get('models', [])
+            models = _remember_models(response.json())
             model_count = len(models)
 
             # Line 2: The Discovery
@@ -279,6 +505,74 @@ def check_ollama_connection(
         return False
 
 
+def _remember_models(tags: Dict[str, Any]) -> List[str]:
+    """Record the model names from an /api/tags response in the short-lived cache."""
+    global _models_cache
+    models = [m['name'] for m in tags.get('models', []) if 'name' in m]
+    _models_cache = (time.monotonic(), models)
+    return models
+
+
+def fetch_ollama_models(timeout: float = 3, max_age: float = MODELS_CACHE_TTL) -> Optional[List[str]]:
+    """
+    List installed Ollama models via the HTTP API.
+
+    A listing fetched within the last max_age seconds (by this function or by
+    check_ollama_connection) is reused instead of querying Ollama again.
+
+    Args:
+        timeout: Request timeout in seconds
+        max_age: Maximum age in seconds of a cached listing; 0 forces a fetch
+
+    Returns:
+        List of model names, or None if Ollama did not answer
+    """
+    cached = _models_cache
+    if cached and time.monotonic() - cached[0] < max_age:
+        return list(cached[1])
+
+    try:
+        response = _SESSION.get(OLLAMA_TAGS_URL, timeout=timeout)
+        if response.status_code != 200:
+            return None
+        return list(_remember_models(response.json()))
+    except (requests.exceptions.RequestException, ValueError, KeyError, TypeError):
+        return None
+
+
+def preload_model(
+    model_name: str,
+    log_callback: Callable[[str], None] = no_op_logger,
+    keep_alive: str = "30m"
+) -> bool:
+    """
+    Load a model into Ollama before a parallel batch starts.
+
+    A chat request with no messages just loads the model. Issuing it once up
+    front means the worker pool's first requests hit a resident model instead
+    of all queueing behind the same cold load.
+
+    Args:
+        model_name: Ollama model to load
+        log_callback: Logging function
+        keep_alive: How long Ollama should keep the model resident
+
+    Returns:
+        True if Ollama confirmed the model is loaded, False otherwise
+    """
+    try:
+        response = _SESSION.post(
+            OLLAMA_URL,
+            json={"model": model_name, "messages": [], "keep_alive": keep_alive},
+            timeout=INGEST_TIMEOUT
+        )
+        response.raise_for_status()
+        return True
+    except requests.exceptions.RequestException as e:
+        log_callback(f"   [yellow]Could not preload {model_name}:[/yellow] {e}")
+        return False
+
+
 # ==============================================================================
 # AI IMAGE ANALYSIS
 # ==============================================================================
@@ -299,33 +593,24 @@ def get_ai_description(
     Returns:
         Tuple of (filename: str, tags: List[str]) or (None, None) on failure
     """
-    base64_image = encode_image(image_path, log_callback)
+    base64_image = _encode_image_b64(image_path, log_callback)
     if not base64_image:
         return None, None
 
-    AI_NAMING_PROMPT = """You are an expert file-naming AI.
-Analyze this image and generate a concise, descriptive filename and three relevant tags.
-You MUST return ONLY a single, valid JSON object, formatted *exactly* like this:
-{
-  "filename": "<a-concise-and-descriptive-filename>",
-  "tags": ["<tag1>", "<tag2>", "<tag3>"]
-}
-"""
-
-    payload = {
-        "model": model_name,
-        "messages": [
-            { "role": "user", "content": AI_NAMING_PROMPT, "images": [base64_image] }
-        ],
-        "stream": False,
-        "format": "json"
-    }
-
     try:
-        response = requests.post(OLLAMA_URL, json=payload, timeout=INGEST_TIMEOUT)
+        response = _SESSION.post(
+            OLLAMA_URL,
+            data=_chat_request_body(
+                model_name, AI_NAMING_PROMPT, base64_image,
+                response_format=NAMING_SCHEMA,
+                options={"num_predict": NAMING_MAX_TOKENS}
+            ),
+            headers=_JSON_HEADERS,
+            timeout=INGEST_TIMEOUT
+        )
         response.raise_for_status()
         result = response.json()
-        json_string = result['message']['content'].strip()
+        json_string = _strip_markdown_fences(result['message']['content'])
         data = json.loads(json_string)
         filename = data.get("filename")
         tags = data.get("tags")
@@ -345,6 +630,83 @@ You MUST return ONLY a single, valid JSON object, formatted *exactly* like this:
         return None, None
 
 
+# AI naming cache entries older than this (seconds) are re-run
+AI_CACHE_TTL = 600
+
+
+def _lookup_cached_ai_name(
+    img_path: Path,
+    model: str,
+    cache: Dict[str, Dict],
+    cache_lock: Optional[threading.Lock]
+) -> Tuple[str, float, str, Optional[Dict[str, Any]]]:
+    """
+    Look up an AI naming cache entry and classify it.
+
+    Single source of the cache rules (model-aware key, unchanged mtime,
+    age under AI_CACHE_TTL) for get_ai_name_with_cache and has_cached_ai_name.
+
+    Args:
+        img_path: Image file path
+        model: Ollama model name
+        cache: Cache dict
+        cache_lock: Optional threading.Lock for thread-safe cache access
+
+    Returns:
+        Tuple of (cache_key, current_mtime, status, entry) where status is
+        'hit', 'miss', 'changed' or 'expired'
+
+    Raises:
+        OSError: If the image can't be stat'd
+    """
+    # Model-aware cache key (critical: different models = different results)
+    cache_key = f"{model}:{str(img_path.absolute())}"
+    current_mtime = img_path.stat().st_mtime
+
+    # Thread-safe cache read
+    if cache_lock:
+        with cache_lock:
+            cached_entry = cache.get(cache_key)
+    else:
+        cached_entry = cache.get(cache_key)
+
+    if not cached_entry:
+        status = 'miss'
+    elif cached_entry['mtime'] != current_mtime:
+        status = 'changed'
+    elif time.monotonic() - cached_entry['cached_at'] >= AI_CACHE_TTL:
+        status = 'expired'
+    else:
+        status = 'hit'
+    return cache_key, current_mtime, status, cached_entry
+
+
+def has_cached_ai_name(
+    img_path: Path,
+    model: str,
+    cache: Optional[Dict[str, Dict]],
+    cache_lock: Optional[threading.Lock]
+) -> bool:
+    """
+    Check whether get_ai_name_with_cache would answer from the cache.
+
+    Args:
+        img_path: Image file path
+        model: Ollama model name
+        cache: Optional cache dict
+        cache_lock: Optional threading.Lock for thread-safe cache access
+
+    Returns:
+        True if a fresh entry exists for this model and unchanged file
+    """
+    if cache is None:
+        return False
+    try:
+        return _lookup_cached_ai_name(img_path, model, cache, cache_lock)[2] == 'hit'
+    except OSError:
+        return False
+
+
 def get_ai_name_with_cache(
     img_path: Path,
     model: str,
@@ -375,31 +737,16 @@ def get_ai_name_with_cache(
         # No cache provided, always run AI
         return get_ai_description(img_path, model, log_callback)
 
-    # Model-aware cache key (critical: different models = different results)
-    cache_key = f"{model}:{str(img_path.absolute())}"
-    current_mtime = img_path.stat().st_mtime
-
-    # Thread-safe cache read
-    cached_entry = None
-    if cache_lock:
-        with cache_lock:
-            cached_entry = cache.get(cache_key)
-    else:
-        cached_entry = cache.get(cache_key)
+    cache_key, current_mtime, status, cached_entry = _lookup_cached_ai_name(img_path, model, cache, cache_lock)
 
-    # Check cache validity
-    if cached_entry:
-        # Validate: file unchanged + cache fresh (<10 min)
-        age = time.time() - cached_entry['cached_at']
-        if cached_entry['mtime'] == current_mtime and age < 600:
-            log_callback(f"   [dim]⚡ Using cached AI result[/dim]")
-            return cached_entry['filename'], cached_entry['tags']
-        else:
-            # Cache invalid (file changed or expired)
-            if cached_entry['mtime'] != current_mtime:
-                log_callback(f"   [yellow]File changed, re-running AI[/yellow]")
-            else:
-                log_callback(f"   [dim]Cache expired ({age/60:.1f}m old), re-running AI[/dim]")
+    if status == 'hit':
+        log_callback(f"   [dim]⚡ Using cached AI result[/dim]")
+        return cached_entry['filename'], cached_entry['tags']
+    elif status == 'changed':
+        log_callback(f"   [yellow]File changed, re-running AI[/yellow]")
+    elif status == 'expired':
+        age = time.monotonic() - cached_entry['cached_at']
+        log_callback(f"   [dim]Cache expired ({age/60:.1f}m old), re-running AI[/dim]")
 
     # Cache miss or invalid - run AI
     log_callback(f"   [grey]🤖 Generating AI name...[/grey]")
@@ -411,7 +758,7 @@ def get_ai_name_with_cache(
             'filename': filename,
             'tags': tags,
             'mtime': current_mtime,
-            'cached_at': time.time()
+            'cached_at': time.monotonic()
         }
         if cache_lock:
             with cache_lock:
@@ -438,43 +785,29 @@ def critique_single_image(
     Returns:
         Dictionary with critique data, or None on failure
     """
-    base64_image = encode_image(image_path, log_callback)
+    base64_image = _encode_image_b64(image_path, log_callback, use_cache=True)
     if not base64_image:
         log_callback(f"[red]Failed to encode image for critique[/red]")
         return None
 
-    payload = {
-        "model": model_name,
-        "messages": [
-            { "role": "user", "content": AI_CRITIC_PROMPT, "images": [base64_image] }
-        ],
-        "stream": False,
-        "format": "json"
-    }
-
     try:
         log_callback(f"   [grey]Sending to {model_name} for analysis...[/grey]")
-        response = requests.post(OLLAMA_URL, json=payload, timeout=CRITIQUE_TIMEOUT)
+        response = _SESSION.post(
+            OLLAMA_URL,
+            data=_chat_request_body(
+                model_name, AI_CRITIC_PROMPT, base64_image,
+                response_format=CRITIQUE_SCHEMA
+            ),
+            headers=_JSON_HEADERS,
+            timeout=CRITIQUE_TIMEOUT
+        )
         response.raise_for_status()
         result = response.json()
-        json_string = result['message']['content'].strip()
-
-        # Clean up potential markdown formatting
-        if json_string.startswith("```"):
-            json_string = json_string.split("```")[1]
-            if json_string.startswith("json"):
-                json_string = json_string[4:]
-            json_string = json_string.strip()
-
+        json_string = _strip_markdown_fences(result['message']['content'])
         data = json.loads(json_string)
 
-        # Validate expected fields
-        expected_fields = [
-            "composition_score", "composition_critique", "lighting_critique",
-            "color_critique", "final_verdict", "creative_mood", "creative_suggestion"
-        ]
-
-        for field in expected_fields:
+        # Schema-constrained decoding should guarantee these; cheap sanity check
+        for field in CRITIQUE_SCHEMA["required"]:
             if field not in data:
                 log_callback(f"[yellow]Warning: Missing field '{field}' in critique response[/yellow]")
 